@@ -1,7 +1,88 @@
+import re
+import threading
+from concurrent.futures import Future
+
+import orjson
+from cachetools import TTLCache
 from flask import Flask, request, jsonify
+from flask.json.provider import DefaultJSONProvider
+from flask_compress import Compress
 from scraper import scrape_website
 
+class OrjsonProvider(DefaultJSONProvider):
+    """Serve jsonify() and request.get_json() through orjson."""
+
+    def dumps(self, obj, **kwargs):
+        # orjson has no separators or ensure_ascii knobs; map the rest. Like
+        # the stdlib encoder, accept non-str keys, and hand datetimes to
+        # Flask's default so they keep the HTTP-date format
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        default = kwargs.get("default", self.default)
+        return orjson.dumps(obj, default=default, option=option).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+class SingleFlight:
+    """Let concurrent callers with the same key share one in-flight call."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, fn):
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+        if leader:
+            try:
+                future.set_result(fn())
+            except BaseException as e:
+                future.set_exception(e)
+            finally:
+                with self._lock:
+                    del self._calls[key]
+        return future.result()
+
+MAX_PAYLOAD = 64 * 1024
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+app.config["MAX_CONTENT_LENGTH"] = MAX_PAYLOAD
+app.config["COMPRESS_ALGORITHM"] = ["br", "gzip"]
+app.config["COMPRESS_LEVEL"] = 4
+Compress(app)
+
+# Cheap up-front check so malformed URLs never reach the network
+_URL_RE = re.compile(r"https?://[^\s/?#]+[^\s]*", re.I)
+
+# Successful scrapes keyed by URL; errors are never cached
+_scrape_cache = TTLCache(maxsize=1024, ttl=3600)
+_cache_lock = threading.Lock()
+_inflight = SingleFlight()
+
+def _scrape_and_store(url):
+    # Runs inside the in-flight call so the entry is cached before the key
+    # is released; a late arrival then hits the cache instead of refetching
+    result = scrape_website(url)
+    if "error" not in result:
+        with _cache_lock:
+            _scrape_cache[url] = result
+    return result
+
+def cached_scrape(url, refresh=False):
+    if not refresh:
+        with _cache_lock:
+            hit = _scrape_cache.get(url)
+        if hit is not None:
+            return hit
+    return _inflight.do(url, lambda: _scrape_and_store(url))
 
 @app.route("/")
 def home():
@@ -9,9 +90,13 @@ def home():
 
 @app.route("/scrape", methods=["POST"])
 def scrape():
-    data = request.get_json()
-    url = data.get("url")
+    if request.content_length and request.content_length > MAX_PAYLOAD:
+        return jsonify({"error": "Payload too large"}), 413
+    data = request.get_json(silent=True)
+    url = data.get("url") if isinstance(data, dict) else None
     if not url:
         return jsonify({"error": "URL is required"}), 400
-    result = scrape_website(url)
+    if not (isinstance(url, str) and _URL_RE.fullmatch(url)):
+        return jsonify({"error": "URL must be an absolute http(s) URL"}), 400
+    result = cached_scrape(url, refresh=request.args.get("no_cache") == "1")
     return jsonify(result)
@@ -1,11 +1,43 @@
-from fastapi import FastAPI, Request
+import asyncio
+import json
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request, Response
+from fastapi.middleware.gzip import GZipMiddleware
 from playwright.async_api import async_playwright
 
-app = FastAPI()
+# One browser per process, launched on first use; each request gets its own
+# context so cookies and storage don't leak between scrapes
+_playwright = None
+_browser = None
+_browser_lock = asyncio.Lock()
+
+async def get_browser():
+    global _playwright, _browser
+    async with _browser_lock:
+        if _browser is None or not _browser.is_connected():
+            if _playwright is None:
+                _playwright = await async_playwright().start()
+            _browser = await _playwright.chromium.launch()
+    return _browser
+
+@asynccontextmanager
+async def lifespan(app):
+    yield
+    if _browser is not None:
+        await _browser.close()
+    if _playwright is not None:
+        await _playwright.stop()
+
+app = FastAPI(lifespan=lifespan)
+app.add_middleware(GZipMiddleware, minimum_size=500)
+
+# Constant liveness payload, serialized once instead of on every probe
+_ROOT_BODY = json.dumps({"message": "Scraper is alive"}).encode()
 
 @app.get("/")
 async def root():
-    return {"message": "Scraper is alive"}
+    return Response(_ROOT_BODY, media_type="application/json")
 
 @app.post("/scrape")
 async def scrape(request: Request):
@@ -15,17 +47,18 @@ async def scrape(request: Request):
     if not url:
         return {"error": "Missing 'url' in request"}
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch()
-        page = await browser.new_page()
+    browser = await get_browser()
+    context = await browser.new_context()
+    try:
+        page = await context.new_page()
         await page.goto(url)
 
         content = await page.content()
         title = await page.title()
+    finally:
+        await context.close()
 
-        await browser.close()
-
-        return {
-            "title": title,
-            "html": content[:2000]  # Only return first 2000 chars
-        }
+    return {
+        "title": title,
+        "html": content[:2000]  # Only return first 2000 chars
+    }
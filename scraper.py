@@ -1,32 +1,58 @@
-from bs4 import BeautifulSoup
+from http.cookiejar import DefaultCookiePolicy
+
+from bs4 import BeautifulSoup, NavigableString
 import requests
 
+# Shared across calls so connections to the same host are pooled; cookies
+# are refused so one scrape's state never rides along on the next
+_SESSION = requests.Session()
+_SESSION.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
 def scrape_website(url):
     try:
-        res = requests.get(url, timeout=10)
-        soup = BeautifulSoup(res.text, 'html.parser')
-
-        # Extract structured sections
-        title = soup.title.string if soup.title else "No Title"
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
-        meta_desc = meta_desc['content'] if meta_desc else "No meta description"
-
-        # Look for content-heavy divs or sections
-        paragraphs = soup.find_all('p')
-        content_text = ' '.join(p.get_text() for p in paragraphs[:10])  # Adjust for depth
-
-        # Look for keywords in headers or section titles
-        about = soup.find(string=lambda t: t and "about" in t.lower())
-        services = soup.find(string=lambda t: t and "service" in t.lower())
-
-        return {
-            "title": title,
-            "description": meta_desc,
-            "content_snippet": content_text.strip(),
-            "has_about_section": bool(about),
-            "has_services_section": bool(services),
-            "url": url
-        }
+        res = _SESSION.get(url, timeout=10)
+        # Parse the raw bytes: without a header charset requests assumes
+        # ISO-8859-1 for text/*, garbling UTF-8 pages; the parser honours the
+        # page's own <meta charset> (or sniffs) instead
+        charset = 'charset' in res.headers.get('Content-Type', '').lower()
+        soup = BeautifulSoup(res.content, 'lxml',
+                             from_encoding=res.encoding if charset else None)
+        return _extract_from_soup(soup, url)
 
     except Exception as e:
         return {"error": str(e), "url": url}
+
+def _extract_from_soup(soup, url):
+    """Pull the summary fields out of an already-parsed page."""
+    # Extract structured sections
+    # Copy to a plain str: a NavigableString keeps the whole tree alive
+    # through its parent links, and results outlive the soup in app's cache
+    title = soup.title.string if soup.title else "No Title"
+    title = str(title) if title is not None else None
+    meta_desc = soup.find('meta', attrs={'name': 'description'})
+    meta_desc = meta_desc['content'] if meta_desc else "No meta description"
+
+    # Look for content-heavy divs or sections
+    paragraphs = soup.find_all('p')
+    content_text = ' '.join(p.get_text() for p in paragraphs[:10])  # Adjust for depth
+
+    # Look for keywords in headers or section titles; one pass over the
+    # text nodes, stopping as soon as both have been seen
+    about = services = False
+    for node in soup.descendants:
+        if not isinstance(node, NavigableString) or not node:
+            continue
+        text = node.lower()
+        about = about or "about" in text
+        services = services or "service" in text
+        if about and services:
+            break
+
+    return {
+        "title": title,
+        "description": meta_desc,
+        "content_snippet": content_text.strip(),
+        "has_about_section": bool(about),
+        "has_services_section": bool(services),
+        "url": url
+    }